@@ -1,6 +1,6 @@
 import textwrap
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import wraps, cached_property
 from inspect import getdoc
 from typing import Optional, Any, NamedTuple, Callable
 
@@ -50,12 +50,13 @@ class Command:
             key=lambda x: (-x.is_required, x.name),
         )
 
-    @property
+    @cached_property
     def options_sorted(self) -> list[CommandOption]:
         """Sorts with the following order:
         - positional
         - keyword required
         - keyword optional
+        Computed once since the options are set when registering the command
         """
         return self.positional_args + self.keyword_args
 
@@ -142,11 +143,14 @@ class CommandGroup:
     def command_names(self) -> set[str]:
         return set(self._commands.keys()) | (self._command_groups.keys())
 
+    def _has_command(self, name: str) -> bool:
+        return name in self._commands or name in self._command_groups
+
     def add_group(self, group: "CommandGroup"):
         if group.name is None:
             raise NotImplementedError("A group must have a name")
 
-        if group.name in self.command_names:
+        if self._has_command(group.name):
             raise DuplicatedCommandError(f"Duplicated command found for {group.name!r}", group.name)
         group.on_cmd_run = self.on_cmd_run
         self._command_groups[group.name] = group
@@ -159,7 +163,7 @@ class CommandGroup:
         description: Optional[str] = None,
     ):
         cmd_name = cmd or f.__name__
-        if cmd_name in self.commands:
+        if self._has_command(cmd_name):
             raise DuplicatedCommandError(f"Duplicated command found for {cmd_name!r}", cmd_name)
 
         _options, _derived_options = extract_function_info(f)
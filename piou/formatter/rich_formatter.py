@@ -1,5 +1,6 @@
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Union
 
 from rich.console import Console, RenderableType
@@ -11,6 +12,15 @@ from .base import Formatter, Titles
 from ..command import Command, CommandOption, ParentArgs, CommandGroup
 
 
+_PASSWORD_MASK = "*" * 6
+
+
+@lru_cache(maxsize=1)
+def get_program_name() -> str:
+    """Name of the running program, cached since `sys.argv[0]` does not change for a given process"""
+    return sys.argv[0].rpartition("/")[2]
+
+
 def pad(s: RenderableType, padding_left: int = 1):
     return Padding(s, (0, padding_left))
 
@@ -27,40 +37,48 @@ def fmt_option(option: CommandOption, show_full: bool = False, color: str = "whi
         else:
             return f"[{color}]{first_arg}[/{color}]{required}"
     else:
-        return "[" + sorted(option.keyword_args)[-1] + "]"
+        return f"[{max(option.keyword_args)}]"
 
 
 def fmt_cmd_options(options: list[CommandOption]) -> str:
-    return (
-        " ".join([fmt_option(x) for x in options]) if options else ""  # '[<arg1>] ... [<argN>]'
-    )
+    # '[<arg1>] ... [<argN>]', empty string if no options
+    return " ".join(fmt_option(x) for x in options)
+
+
+def _attach(help_text: Optional[str], suffix: str) -> str:
+    """Appends `suffix` to the help text if any"""
+    return f"{help_text} {suffix}" if help_text else suffix
 
 
 def fmt_help(
     option: CommandOption,
     show_default: bool,
     *,
-    markdown_open: Optional[str] = "[bold]",
-    markdown_close: Optional[str] = "[/bold]",
+    markdown_open: str = "[bold]",
+    markdown_close: str = "[/bold]",
 ):
     _choices = option.get_choices()
-    _markdown_open, _markdown_close = markdown_open or "", markdown_close or ""
+    _help, _default = option.help, option.default
 
-    if show_default and option.default is not None and not option.is_required:
-        default_str = option.default if not option.is_password else "******"
-        default_str = f"{_markdown_open}(default: {default_str}){_markdown_close}"
-        return option.help + f" {default_str}" if option.help else default_str
+    if show_default and _default is not None and not option.is_required:
+        default_str = _default if not option.is_password else _PASSWORD_MASK
+        default_str = f"{markdown_open}(default: {default_str}){markdown_close}"
+        return _attach(_help, default_str)
     elif _choices is not None and not option.hide_choices:
         if len(_choices) <= 3:
             possible_choices = ", ".join(str(_choice) for _choice in _choices)
-            choices_help = f"{_markdown_open}(choices are: {possible_choices}){_markdown_close}"
+            choices_help = f"{markdown_open}(choices are: {possible_choices}){markdown_close}"
         else:
-            sep = " \n - "
-            possible_choices = sep + sep.join(str(_choice) for _choice in _choices)
-            choices_help = f"\n{_markdown_open}Possible choices are:" + possible_choices + _markdown_close
-        return option.help + f" {choices_help}" if option.help else choices_help
+            choices_help = "".join(
+                [
+                    f"\n{markdown_open}Possible choices are:",
+                    *(f" \n - {_choice}" for _choice in _choices),
+                    markdown_close,
+                ]
+            )
+        return _attach(_help, choices_help)
     else:
-        return option.help
+        return _help
 
 
 def get_usage(
@@ -70,9 +88,9 @@ def get_usage(
     parent_args: Optional[ParentArgs] = None,
 ):
     parent_args = parent_args or []
-    _global_options = " ".join(["[" + sorted(x.keyword_args)[-1] + "]" for x in global_options])
+    _global_options = " ".join(f"[{max(x.keyword_args)}]" for x in global_options)
     command = f"[underline]{command}[/underline]" if command else "<command>"
-    cmds = [sys.argv[0].split("/")[-1]] + [x.cmd for x in parent_args]
+    cmds = [get_program_name()] + [x.cmd for x in parent_args]
     cmds = " ".join(f"[underline]{x}[/underline]" for x in cmds)
 
     usage = cmds
@@ -95,14 +113,23 @@ class RichTitles(Titles):
     DESCRIPTION = f"[bold]{Titles.DESCRIPTION}[/bold]"
     ARGUMENTS = f"[bold]{Titles.ARGUMENTS}[/bold]"
     OPTIONS = f"[bold]{Titles.OPTIONS}[/bold]"
+    # Variants preceded by an empty line
+    NL_GLOBAL_OPTIONS = "\n" + GLOBAL_OPTIONS
+    NL_OPTIONS = "\n" + OPTIONS
 
 
 MIN_MARKDOWN_SIZE: int = 75
 
+_SHARED_CONSOLE = Console(markup=True, highlight=False)
+"""Console shared by all the `RichFormatter` instances so that the terminal
+capabilities are only probed once"""
+
 
 @dataclass
 class RichFormatter(Formatter):
-    _console: Console = field(init=False, default_factory=lambda: Console(markup=True, highlight=False))
+    _console: Console = field(init=False, default_factory=lambda: _SHARED_CONSOLE)
+    """Defaults to the shared console, a custom one can still be set on the instance
+    (the `print_fn` needs to be updated accordingly)"""
     cmd_color: str = "cyan"
     option_color: str = "cyan"
     default_color: str = "white"
@@ -121,13 +148,24 @@ class RichFormatter(Formatter):
     def __post_init__(self):
         self.print_fn = self._console.print
 
+    def print_help(
+        self,
+        *,
+        group: CommandGroup,
+        command: Optional[Command] = None,
+        parent_args: Optional[ParentArgs] = None,
+    ) -> None:
+        # Buffering the output so the help is written to the terminal at once
+        with self._console:
+            super().print_help(group=group, command=command, parent_args=parent_args)
+
     def _print_description(self, item: Union[CommandGroup, Command]):
         description = item.description or item.help
         if description:
             self.print_fn()
             self.print_fn(RichTitles.DESCRIPTION)
             if self.use_markdown:
-                _max_width = max(len(x) for x in description.split("\n"))
+                _max_width = max(map(len, description.splitlines()), default=0)
                 self.print_fn(
                     pad(
                         Markdown(
@@ -211,29 +249,32 @@ class RichFormatter(Formatter):
                 ]
             )
         if command.keyword_args:
-            self.print_fn("\n" + RichTitles.OPTIONS)
+            self.print_fn(RichTitles.NL_OPTIONS)
             self._print_options(command.keyword_args)
 
         global_options = options + [
             parent_option for parent_arg in (parent_args or []) for parent_option in parent_arg.options
         ]
         if global_options:
-            self.print_fn("\n" + RichTitles.GLOBAL_OPTIONS)
+            self.print_fn(RichTitles.NL_GLOBAL_OPTIONS)
             self._print_options(global_options)
 
         self._print_description(command)
 
     def print_cmd_group_help(self, group: CommandGroup, parent_args: ParentArgs):
-        parent_commands = [sys.argv[0].split("/")[-1]] + [x.cmd for x in parent_args]
+        parent_commands = [get_program_name()] + [x.cmd for x in parent_args]
+        # Same for every command of the group
+        parent_prefix = " ".join(f"[underline]{x}[/underline]" for x in parent_commands)
+        group_opts_fmt = fmt_cmd_options(group.options)
+        if group_opts_fmt:
+            parent_prefix = f"{parent_prefix} {group_opts_fmt}"
         commands_str = []
         for i, (cmd_name, cmd) in enumerate(group.commands.items()):
-            _cmds = []
-            for cmd_lvl, x in enumerate(parent_commands + [cmd_name]):
-                _cmds.append(f"[underline]{x}[/underline]")
-                if group.options and cmd_lvl == len(parent_commands) - 1:
-                    _cmds.append(fmt_cmd_options(group.options))
-            _cmds_str = " ".join(_cmds)
-            _line = f'{"" if i == 0 else "or: ":>5}{_cmds_str} {fmt_cmd_options(cmd.options_sorted)}'.rstrip()
+            cmd_opts = fmt_cmd_options(cmd.options_sorted)
+            _line = (
+                f'{"" if i == 0 else "or: ":>5}{parent_prefix} [underline]{cmd_name}[/underline]'
+                f'{" " + cmd_opts if cmd_opts else ""}'
+            )
             commands_str.append(_line)
         commands_str = "\n".join(commands_str)
 
@@ -249,15 +290,7 @@ class RichFormatter(Formatter):
                 self.print_fn(pad(cmd.help, padding_left=4))
                 self.print_fn()
             if cmd.options:
-                self.print_rows(
-                    [
-                        (
-                            fmt_option(opt, show_full=True, color=self.option_color),
-                            self._fmt_help(opt),
-                        )
-                        for opt in cmd.options_sorted
-                    ]
-                )
+                self._print_options(cmd.options_sorted)
                 self.print_fn()
 
         if group.options:
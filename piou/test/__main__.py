@@ -47,21 +47,25 @@ def foo_main(
     A test command
     """
     print("Running foo")
-    for name, value in [
-        ("foo1", foo1),
-        ("foo2", foo2),
-        ("foo3", foo3),
-        ("foo4", foo4),
-        ("foo5", foo5),
-        ("foo6", foo6),
-        ("foo7", foo7),
-        ("foo8", foo8),
-        ("foo9", foo9),
-        ("foo10", foo10),
-        ("foo11", foo11),
-        ("foo12", foo12),
-    ]:
-        print(f"{name} = {value} ({type(value)})")
+    print(
+        "\n".join(
+            f"{name} = {value} ({type(value)})"
+            for name, value in [
+                ("foo1", foo1),
+                ("foo2", foo2),
+                ("foo3", foo3),
+                ("foo4", foo4),
+                ("foo5", foo5),
+                ("foo6", foo6),
+                ("foo7", foo7),
+                ("foo8", foo8),
+                ("foo9", foo9),
+                ("foo10", foo10),
+                ("foo11", foo11),
+                ("foo12", foo12),
+            ]
+        )
+    )
 
 
 @cli.command(cmd="bar", help="Run bar command")
@@ -91,8 +95,12 @@ def sub_foo_main(
     foo2: str = Option(..., "-f", "--foo2", help="Foo2 argument"),
     foo3: str = Option(None, "--foo3", help="Foo3 argument"),
 ):
-    for name, value in [("test", test), ("foo1", foo1), ("foo2", foo2), ("foo3", foo3)]:
-        print(f"{name} = {value} ({type(value)})")
+    print(
+        "\n".join(
+            f"{name} = {value} ({type(value)})"
+            for name, value in [("test", test), ("foo1", foo1), ("foo2", foo2), ("foo3", foo3)]
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -174,6 +174,8 @@ class CommandOption(Generic[T]):
 
     _name: Optional[str] = field(init=False, default=None)
     _data_type: type[T] = field(init=False, default=Any)  # noqa
+    # Computed once when setting the data type
+    _literal_values: list = field(init=False, default_factory=list)
 
     # Only for literal types
     case_sensitive: bool = True
@@ -191,13 +193,15 @@ class CommandOption(Generic[T]):
 
     @property
     def literal_values(self):
-        return get_literals_union_args(self.data_type)
+        return self._literal_values
 
     @data_type.setter
     def data_type(self, v: type[T]):
-        if self.choices and get_literals_union_args(v):
+        literal_values = get_literals_union_args(v)
+        if self.choices and literal_values:
             raise ValueError("Pick either a Literal type or choices")
         self._data_type = v
+        self._literal_values = literal_values
 
     @property
     def is_password(self):
@@ -205,7 +209,7 @@ class CommandOption(Generic[T]):
 
     @property
     def name(self):
-        return self._name or keyword_arg_to_name(sorted(self.keyword_args)[0])
+        return self._name or keyword_arg_to_name(min(self.keyword_args))
 
     @name.setter
     def name(self, name: Optional[str]):
@@ -264,6 +268,26 @@ def Option(
     )
 
 
+_SHLEX_SPECIAL_CHARS = frozenset("'\"\\")
+
+
+def _shlex_split(cmd: str) -> list[str]:
+    """
+    Same as `shlex.split` but uses the faster `str.split` when there is
+    nothing to unquote or unescape
+    """
+    if cmd.isprintable() and _SHLEX_SPECIAL_CHARS.isdisjoint(cmd):
+        return cmd.split()
+    return shlex.split(cmd)
+
+
+def _quote_arg(arg: str) -> str:
+    """Only quotes the argument when needed, so that `_shlex_split` can take its fast path"""
+    if arg and arg.isprintable() and " " not in arg and _SHLEX_SPECIAL_CHARS.isdisjoint(arg):
+        return arg
+    return f"'{arg}'"
+
+
 def _split_cmd(cmd: str) -> list[str]:
     """
     Utility to split a string containing arrays like --foo 1 2 3
@@ -278,7 +302,7 @@ def _split_cmd(cmd: str) -> list[str]:
     is_pos_arg = True
     buff = []
     cmd_split = []
-    for arg in shlex.split(cmd):
+    for arg in _shlex_split(cmd):
         if arg.startswith("-"):
             if buff:
                 reset_buff()
@@ -366,7 +390,7 @@ KeywordParam = namedtuple("KeywordParam", ["name", "validate"])
 
 def convert_args_to_dict(input_args: list[str], options: list[CommandOption]) -> dict:
     _input_pos_args, _input_keyword_args = get_cmd_args(
-        " ".join(f"'{x}'" for x in input_args),
+        " ".join(_quote_arg(x) for x in input_args),
         {name: opt.data_type for opt in options for name in opt.names},
     )
     positional_args, keyword_args = [], {}
@@ -219,6 +219,33 @@ def test_get_cmd_args(input_str, types, expected_pos_args, expected_key_args):
     assert key_args == expected_key_args
 
 
+@pytest.mark.parametrize(
+    "input_str",
+    ["--foo buz -b baz", "foo  bar", "", '--foo "buz biz"', "--foo 'buz'", r"--foo buz\ biz", "--foo\tbuz"],
+)
+def test_shlex_split(input_str):
+    import shlex
+    from piou.utils import _shlex_split
+
+    assert _shlex_split(input_str) == shlex.split(input_str)
+
+
+@pytest.mark.parametrize(
+    "input_args, expected",
+    [
+        (["baz", "--foo", "buz"], {"baz": "baz", "foo": "buz"}),
+        (["baz buz", "--foo", "buz biz"], {"baz": "baz buz", "foo": "buz biz"}),
+        (["", "--foo", "-"], {"baz": "", "foo": "-"}),
+    ],
+)
+def test_convert_args_to_dict_quoting(input_args, expected):
+    from piou.utils import Option, convert_args_to_dict
+
+    baz, foo = Option(...), Option(..., "--foo")
+    baz.name, foo.name = "baz", "foo"
+    assert convert_args_to_dict(input_args, options=[baz, foo]) == expected
+
+
 @pytest.mark.parametrize(
     "input_str, args, expected",
     [
@@ -306,6 +333,17 @@ def test_invalid_command_options_choices():
         opt.data_type = Literal["foo"]
 
 
+def test_command_option_literal_values():
+    from piou.command import CommandOption
+
+    opt = CommandOption(None)
+    assert opt.get_choices() is None
+    opt.data_type = Literal["foo", "bar"]
+    assert opt.get_choices() == ["foo", "bar"]
+    opt.data_type = str
+    assert opt.get_choices() is None
+
+
 def test_command_async():
     from piou.command import Command
 
@@ -347,6 +385,21 @@ def test_command_raises_error_on_duplicate_args():
         )
 
 
+def test_duplicated_command():
+    from piou import Cli
+    from piou.exceptions import DuplicatedCommandError
+
+    cli = Cli()
+    cli.add_command("foo", lambda: None)
+    cli.add_sub_parser("bar")
+    with pytest.raises(DuplicatedCommandError, match="Duplicated command found for 'foo'"):
+        cli.add_command("foo", lambda: None)
+    with pytest.raises(DuplicatedCommandError, match="Duplicated command found for 'bar'"):
+        cli.add_command("bar", lambda: None)
+    with pytest.raises(DuplicatedCommandError, match="Duplicated command found for 'foo'"):
+        cli.add_sub_parser("foo")
+
+
 def test_command_wrapper_help():
     from piou import Cli
 
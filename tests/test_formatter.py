@@ -53,7 +53,7 @@ def test_fmt_help(default, data_type, show_default, expected):
 
     option = CommandOption(default)
     option.data_type = data_type
-    output = fmt_help(option, show_default, markdown_open=None, markdown_close=None)
+    output = fmt_help(option, show_default, markdown_open="", markdown_close="")
     assert output == expected
 
 
@@ -474,3 +474,34 @@ def test_rich_formatting_default(name, cli_fn, args, expected, capsys):
     cli.run_with_args(*args)
     output = capsys.readouterr().out
     _compare_str(output.strip(), expected.strip())
+
+
+def test_rich_formatting_help_single_write(monkeypatch):
+    import io
+    import sys
+    from piou.formatter import RichFormatter
+
+    writes = []
+
+    class Stdout(io.StringIO):
+        def write(self, s):
+            writes.append(s)
+            return super().write(s)
+
+    monkeypatch.setattr(sys, "stdout", Stdout())
+    cli = get_cmd_group_cli_with_global_opt(RichFormatter())
+    cli.run_with_args("sub-cmd", "-h")
+    assert len(writes) == 1
+
+
+def test_get_program_name(monkeypatch):
+    import sys
+    from piou.formatter.rich_formatter import get_program_name
+
+    get_program_name.cache_clear()
+    monkeypatch.setattr(sys, "argv", ["/usr/local/bin/my-cli"])
+    assert get_program_name() == "my-cli"
+    # Cached for the rest of the process
+    monkeypatch.setattr(sys, "argv", ["/usr/local/bin/other-cli"])
+    assert get_program_name() == "my-cli"
+    get_program_name.cache_clear()